@@ -99,8 +99,9 @@ def _lazy_extract_frames(cap: cv2.VideoCapture, max_frames: Optional[int] = None
     cap.release()
 
 
-def save_video(output_path: str, frames: List[np.ndarray], fps: int) -> None:
+def save_video(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
     """Save a video locally. Depending on the extension, the video will be saved as a .mp4 file or as a .gif file.
+    Safe for generator of frames object, which are written one by one as they are generated.
 
     :param output_path: Where the video will be saved
     :param frames:      Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
@@ -139,6 +140,7 @@ def save_mp4(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
     :param fps:         Frames per second
     """
     video_height, video_width, video_writer = None, None, None
+    bgr_frame = None
 
     for frame in frames:
         if video_height is None:
@@ -150,9 +152,12 @@ def save_mp4(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
                 (video_width, video_height),
             )
         _validate_frame(frame, video_height, video_width)
-        video_writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+        # The frame is converted to BGR in the same buffer for every frame, since the writer does not keep a reference to it.
+        bgr_frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=bgr_frame)
+        video_writer.write(bgr_frame)
 
-    video_writer.release()
+    if video_writer is not None:
+        video_writer.release()
 
 
 def _validate_frame(frame: np.ndarray, control_height: int, control_width: int) -> None:
@@ -200,8 +205,9 @@ def show_video_from_disk(video_path: str, window_name: str = "Prediction"):
     cv2.waitKey(1)
 
 
-def show_video_from_frames(frames: List[np.ndarray], fps: float, window_name: str = "Prediction") -> None:
-    """Display a video from a list of frames using OpenCV.
+def show_video_from_frames(frames: Iterable[np.ndarray], fps: float, window_name: str = "Prediction") -> None:
+    """Display a video from an iterable of frames using OpenCV.
+    Safe for generator of frames object, which are displayed one by one as they are generated.
 
     :param frames:      Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
     :param fps:         Frames per second
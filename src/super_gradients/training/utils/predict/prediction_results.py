@@ -1,17 +1,22 @@
 import os
+import queue
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Iterator, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Iterator, Iterable, Union, FrozenSet, TypeVar
 
 import cv2
 import numpy as np
+import torch
 
 from super_gradients.common.factories.bbox_format_factory import BBoxFormatFactory
 from super_gradients.training.utils.media.image import show_image, save_image
 from super_gradients.training.utils.media.video import show_video_from_frames, save_video
 from super_gradients.training.utils.visualization.detection import draw_bbox
 from super_gradients.training.utils.visualization.classification import draw_label
-from super_gradients.training.utils.visualization.segmentation import overlay_segmentation
+from super_gradients.training.utils.visualization.segmentation import overlay_segmentation, add_segmentation_legend, get_color_lut, blend_segmentation_batch
 
 from super_gradients.training.utils.visualization.utils import generate_color_mapping
 from .predictions import Prediction, DetectionPrediction, ClassificationPrediction, SegmentationPrediction
@@ -19,6 +24,142 @@ from ...datasets.data_formats.bbox_formats import convert_bboxes
 
 from tqdm import tqdm
 
+# Drawing (OpenCV) and saving (image encoding + disk write) release the GIL, so images can be processed in parallel threads.
+_DEFAULT_SAVE_NUM_WORKERS = min(8, os.cpu_count() or 1)
+
+_BBOX_FORMAT_FACTORY = BBoxFormatFactory()
+
+# Number of items that can be waiting between two stages of the video pipeline (predict -> draw -> encode/display).
+_VIDEO_PIPELINE_QUEUE_SIZE = 8
+
+# Number of video frames predicted ahead of the drawing. Kept small since every prediction holds a full frame.
+_PREDICTIONS_PREFETCH_SIZE = 2
+
+# GPU memory (in bytes) used to blend a batch of segmentation frames, from which the default batch size is derived given the frame resolution.
+_SEGMENTATION_BLEND_GPU_MEMORY = 256 * 1024**2
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=8)
+def _get_class_ids_to_show(class_names: Tuple[str, ...], class_names_to_show: Tuple[str, ...]) -> FrozenSet[int]:
+    """Get the ids of the classes to show. Cached because it is called with the same arguments for every image/frame being drawn.
+
+    :param class_names:         Class names the model was trained on.
+    :param class_names_to_show: Class names to show. Must be a subset of class_names.
+    :return:                    Ids of the classes to show.
+    """
+    class_names_to_show = set(class_names_to_show)
+    invalid_class_names_to_show = class_names_to_show - set(class_names)
+    if len(invalid_class_names_to_show) > 0:
+        raise ValueError(
+            "`class_names` includes class names that the model was not trained on.\n"
+            f"    - Invalid class names:   {list(invalid_class_names_to_show)}\n"
+            f"    - Available class names: {list(class_names)}"
+        )
+    return frozenset(i for i, class_name in enumerate(class_names) if class_name in class_names_to_show)
+
+
+def _get_drawing_order(confidence: np.ndarray) -> np.ndarray:
+    """Get the order in which the predictions should be drawn, i.e. by increasing confidence so that the most confident ones are on top.
+    Predictions usually come out of NMS already sorted by confidence, in which case sorting is skipped.
+
+    :param confidence:  Confidence of each prediction, of shape (N,).
+    :return:            Indices of the predictions, sorted by increasing confidence.
+    """
+    if confidence.size < 2 or np.all(confidence[1:] >= confidence[:-1]):
+        return np.arange(confidence.size)
+    if np.all(confidence[1:] <= confidence[:-1]):
+        return np.arange(confidence.size)[::-1]
+    return np.argsort(confidence, kind="stable")
+
+
+def _get_classes_to_show_mask(labels: np.ndarray, class_ids_to_show: FrozenSet[int]) -> np.ndarray:
+    """Get the mask of the bboxes which belong to the classes to show.
+
+    :param labels:              Class id of each bbox, of shape (N,) or (N, 1).
+    :param class_ids_to_show:   Ids of the classes to show.
+    :return:                    Boolean mask of shape (N,).
+    """
+    return np.isin(np.reshape(labels, -1).astype(np.int32, copy=False), np.fromiter(class_ids_to_show, dtype=np.int32))
+
+
+def _select_bboxes_to_draw(bboxes_xyxy: np.ndarray, labels: np.ndarray, keep_mask: np.ndarray, order: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Select the bboxes of the classes to show, in the order they should be drawn, and cast them to integer pixel coordinates.
+    This is done for all the bboxes at once so that the drawing loop does not do any per-bbox processing.
+
+    :param bboxes_xyxy: Bboxes in xyxy format, of shape (N, 4).
+    :param labels:      Class id of each bbox, of shape (N,) or (N, 1).
+    :param keep_mask:   Mask of the bboxes to draw, of shape (N,), as returned by `_get_classes_to_show_mask`.
+    :param order:       Indices of the bboxes, in the order they should be drawn.
+    :return:            Tuple of
+                            - Indices of the selected bboxes (subset of order), of shape (M,).
+                            - Selected bboxes as int32, of shape (M, 4).
+                            - Class id of each selected bbox as int32, of shape (M,).
+    """
+    order = order[keep_mask[order]]
+    labels = np.reshape(labels, -1)[order].astype(np.int32, copy=False)
+    bboxes = bboxes_xyxy[order].astype(np.int32, copy=False)
+    return order, bboxes, labels
+
+
+def _get_segmentation_class_names(class_names: List[str]) -> List[str]:
+    """Get the class names of a segmentation model, including the background class that is implicit for binary segmentation models.
+
+    :param class_names: Class names the model was trained on.
+    :return:            Class names with a "background" class added first when the model was trained on a single class.
+    """
+    if len(class_names) == 1:
+        return ["background"] + class_names
+    return class_names
+
+
+def _iterate_in_background(iterable: Iterable[T], max_queue_size: int = _VIDEO_PIPELINE_QUEUE_SIZE) -> Iterator[T]:
+    """Iterate over an iterable in a background thread, so that producing the next items overlaps with the processing of the current one.
+    The bounded queue applies backpressure, i.e. the background thread waits when it is more than max_queue_size items ahead.
+
+    :param iterable:        Iterable to iterate over. It is consumed in a background thread.
+    :param max_queue_size:  Maximum number of items produced ahead of the consumer.
+    :return:                Iterator over the same items, in the same order. Exceptions raised by the iterable are re-raised in the consumer thread.
+    """
+    items_queue = queue.Queue(maxsize=max_queue_size)
+    stop_event = threading.Event()
+    end_of_iteration = object()
+
+    def _put(item) -> bool:
+        # Wait for a free slot, unless the consumer stopped iterating (e.g. the display window was closed).
+        while not stop_event.is_set():
+            try:
+                items_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+        except BaseException as e:
+            # Any exception (including BaseException such as KeyboardInterrupt) is forwarded, so the consumer never waits for an item that will not come.
+            _put((None, e))
+        else:
+            _put((end_of_iteration, None))
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exception = items_queue.get()
+            if exception is not None:
+                raise exception
+            if item is end_of_iteration:
+                return
+            yield item
+    finally:
+        stop_event.set()
+
 
 @dataclass
 class ImagePrediction(ABC):
@@ -112,17 +253,18 @@ class ImageDetectionPrediction(ImagePrediction):
         self,
         box_thickness: Optional[int] = None,
         show_confidence: bool = True,
-        color_mapping: Optional[List[Tuple[int, int, int]]] = None,
+        color_mapping: Optional[Union[List[Tuple[int, int, int]], np.ndarray]] = None,
         target_bboxes: Optional[np.ndarray] = None,
         target_bboxes_format: Optional[str] = None,
         target_class_ids: Optional[np.ndarray] = None,
         class_names: Optional[List[str]] = None,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Draw the predicted bboxes on the image.
 
         :param box_thickness:           (Optional) Thickness of bounding boxes. If None, will adapt to the box size.
         :param show_confidence:         Whether to show confidence scores on the image.
-        :param color_mapping:           List of tuples representing the colors for each class.
+        :param color_mapping:           List of tuples representing the colors for each class, or the equivalent uint8 array of shape (num_classes, 3).
                                         Default is None, which generates a default color mapping based on the number of class names.
         :param target_bboxes:           Optional[Union[np.ndarray, List[np.ndarray]]], ground truth bounding boxes.
                                         Can either be an np.ndarray of shape (image_i_object_count, 4) when predicting a single image,
@@ -134,88 +276,112 @@ class ImageDetectionPrediction(ImagePrediction):
                                         ['xyxy','xywh', 'yxyx' 'cxcywh' 'normalized_xyxy' 'normalized_xywh', 'normalized_yxyx', 'normalized_cxcywh'].
                                         Will raise an error if not None and target_bboxes is None.
         :param class_names:             List of class names to show. By default, is None which shows all classes using during training.
+        :param out:                     (Optional) Preallocated array with the same shape and dtype as the image, in which the predicted bboxes are drawn.
+                                        Useful to avoid allocating a new image for every frame of a video.
+                                        It can have any memory layout, but a C-contiguous array avoids an intermediate copy.
+                                        Not used when plotting the target bboxes, since the output is then a new side by side canvas.
 
         :return:                Image with predicted bboxes. Note that this does not modify the original image.
         """
-        image = self.image.copy()
-
         target_bboxes = target_bboxes if target_bboxes is not None else np.zeros((0, 4))
         target_class_ids = target_class_ids if target_class_ids is not None else np.zeros((0, 1))
 
-        class_names_to_show = class_names if class_names else self.class_names
-        class_ids_to_show = [i for i, class_name in enumerate(self.class_names) if class_name in class_names_to_show]
-        invalid_class_names_to_show = set(class_names_to_show) - set(self.class_names)
-        if len(invalid_class_names_to_show) > 0:
-            raise ValueError(
-                "`class_names` includes class names that the model was not trained on.\n"
-                f"    - Invalid class names:   {list(invalid_class_names_to_show)}\n"
-                f"    - Available class names: {list(self.class_names)}"
-            )
+        class_ids_to_show = _get_class_ids_to_show(class_names=tuple(self.class_names), class_names_to_show=tuple(class_names or self.class_names))
 
-        bbox_format_factory = BBoxFormatFactory()
-        if len(target_bboxes):
+        # Target bboxes already in xyxy format (e.g. converted for all the images at once by ImagesDetectionPrediction) are used as is.
+        if len(target_bboxes) and target_bboxes_format != "xyxy":
             target_bboxes_xyxy = convert_bboxes(
                 bboxes=target_bboxes,
                 image_shape=self.prediction.image_shape,
-                source_format=bbox_format_factory.get(target_bboxes_format),
-                target_format=bbox_format_factory.get("xyxy"),
+                source_format=_BBOX_FORMAT_FACTORY.get(target_bboxes_format),
+                target_format=_BBOX_FORMAT_FACTORY.get("xyxy"),
                 inplace=False,
             )
         else:
-            target_bboxes_xyxy = target_bboxes
-
-        plot_targets = any([len(tbbx) > 0 for tbbx in target_bboxes_xyxy])
-        color_mapping = color_mapping or generate_color_mapping(len(self.class_names))
-
-        for pred_i in np.argsort(self.prediction.confidence):
-
-            class_id = int(self.prediction.labels[pred_i])
-            if class_id in class_ids_to_show:
-                score = "" if not show_confidence else str(round(self.prediction.confidence[pred_i], 2))
-                image = draw_bbox(
-                    image=image,
-                    title=f"{self.class_names[class_id]} {score}",
-                    color=color_mapping[class_id],
-                    box_thickness=box_thickness,
-                    x1=int(self.prediction.bboxes_xyxy[pred_i, 0]),
-                    y1=int(self.prediction.bboxes_xyxy[pred_i, 1]),
-                    x2=int(self.prediction.bboxes_xyxy[pred_i, 2]),
-                    y2=int(self.prediction.bboxes_xyxy[pred_i, 3]),
-                )
+            target_bboxes_xyxy = np.asarray(target_bboxes)
+
+        plot_targets = target_bboxes_xyxy.size > 0
+
+        # Skip all the preparation (sorting, color mapping, ...) when no prediction belongs to the classes to show.
+        keep_mask = _get_classes_to_show_mask(self.prediction.labels, class_ids_to_show)
+        if not plot_targets and not keep_mask.any():
+            if out is not None:
+                np.copyto(out, self.image)
+                return out
+            return self.image.copy()
+
+        if color_mapping is None:
+            color_mapping = generate_color_mapping(len(self.class_names))
+        # Contiguous (num_classes, 3) lookup table, to gather the colors of all the bboxes at once. No-op if it is already one.
+        color_lut = np.asarray(color_mapping, dtype=np.uint8)
+
+        # Prepare everything required for drawing in a single vectorized pass, so that the loop below only dispatches draw_bbox calls.
+        order, bboxes, labels = _select_bboxes_to_draw(
+            bboxes_xyxy=self.prediction.bboxes_xyxy,
+            labels=self.prediction.labels,
+            keep_mask=keep_mask,
+            order=_get_drawing_order(self.prediction.confidence),
+        )
+        if show_confidence:
+            scores = np.char.mod("%.2f", self.prediction.confidence[order])
+            titles = [f"{self.class_names[class_id]} {score}" for class_id, score in zip(labels, scores)]
+        else:
+            titles = [f"{self.class_names[class_id]} " for class_id in labels]
+        colors = color_lut[labels].tolist()
 
         if plot_targets:
-            target_image = self.image.copy()
-            for target_idx in range(len(target_bboxes_xyxy)):
-                class_id = int(target_class_ids[target_idx])
-                if class_id in class_ids_to_show:
-                    target_image = draw_bbox(
-                        image=target_image,
-                        title=f"{self.class_names[class_id]}",
-                        color=color_mapping[class_id],
-                        box_thickness=box_thickness,
-                        x1=int(target_bboxes_xyxy[target_idx, 0]),
-                        y1=int(target_bboxes_xyxy[target_idx, 1]),
-                        x2=int(target_bboxes_xyxy[target_idx, 2]),
-                        y2=int(target_bboxes_xyxy[target_idx, 3]),
-                    )
-
-            height, width, ch = target_image.shape
+            # Create a single canvas holding both the predictions (left) and the ground truth (right) panels,
+            # and draw the bboxes directly in the panels instead of on intermediate copies of the image.
+            height, width, ch = self.image.shape
             new_width, new_height = int(width + width / 20), int(height + height / 8)
+            canvas = np.full((new_height, 2 * new_width, ch), 255, dtype=np.uint8)
+            canvas_image, canvas_target = canvas[:, :new_width], canvas[:, new_width:]
 
-            # Crate a new canvas with new width and height.
-            canvas_image = np.ones((new_height, new_width, ch), dtype=np.uint8) * 255
-            canvas_target = np.ones((new_height, new_width, ch), dtype=np.uint8) * 255
-
-            # New replace the center of canvas with original image
+            # New replace the center of each panel with original image
             padding_top, padding_left = 60, 10
+            image = canvas_image[padding_top : padding_top + height, padding_left : padding_left + width]
+            target_image = canvas_target[padding_top : padding_top + height, padding_left : padding_left + width]
+            np.copyto(image, self.image)
+            np.copyto(target_image, self.image)
+        elif out is not None and out.flags.c_contiguous:
+            np.copyto(out, self.image)
+            image = out
+        else:
+            # Also used when `out` is not C-contiguous (e.g. a channel-reversed view), since OpenCV cannot draw in it: it is then copied to `out` below.
+            image = self.image.copy()
 
-            canvas_image[padding_top : padding_top + height, padding_left : padding_left + width] = image
-            canvas_target[padding_top : padding_top + height, padding_left : padding_left + width] = target_image
+        # The image was copied once above, so all the bboxes can be drawn in place.
+        for title, color, (x1, y1, x2, y2) in zip(titles, colors, bboxes.tolist()):
+            draw_bbox(image=image, title=title, color=color, box_thickness=box_thickness, x1=x1, y1=y1, x2=x2, y2=y2, inplace=True)
 
-            img1 = cv2.putText(canvas_image, "Predictions", (int(0.25 * width), 30), cv2.FONT_HERSHEY_COMPLEX, 1, (0, 0, 0))
-            img2 = cv2.putText(canvas_target, "Ground Truth", (int(0.25 * width), 30), cv2.FONT_HERSHEY_COMPLEX, 1, (0, 0, 0))
+        if plot_targets:
+            _, target_bboxes_to_draw, target_labels = _select_bboxes_to_draw(
+                bboxes_xyxy=target_bboxes_xyxy,
+                labels=target_class_ids,
+                keep_mask=_get_classes_to_show_mask(target_class_ids, class_ids_to_show),
+                order=np.arange(len(target_bboxes_xyxy)),
+            )
+            target_colors = color_lut[target_labels].tolist()
+            for class_id, color, (x1, y1, x2, y2) in zip(target_labels, target_colors, target_bboxes_to_draw.tolist()):
+                draw_bbox(
+                    image=target_image,
+                    title=f"{self.class_names[class_id]}",
+                    color=color,
+                    box_thickness=box_thickness,
+                    x1=x1,
+                    y1=y1,
+                    x2=x2,
+                    y2=y2,
+                    inplace=True,
+                )
+
+            cv2.putText(canvas_image, "Predictions", (int(0.25 * width), 30), cv2.FONT_HERSHEY_COMPLEX, 1, (0, 0, 0))
+            cv2.putText(canvas_target, "Ground Truth", (int(0.25 * width), 30), cv2.FONT_HERSHEY_COMPLEX, 1, (0, 0, 0))
 
-            image = cv2.hconcat((img1, img2))
+            image = canvas
+        elif out is not None and image is not out:
+            np.copyto(out, image)
+            image = out
         return image
 
     def show(
@@ -320,14 +486,11 @@ class ImageSegmentationPrediction(ImagePrediction):
         :param class_names:     List of class names to predict (segmentation classes)
         :return:                Image with predicted segmentation. Note that this does not modify the original image.
         """
-        image = self.image.copy()
-        class_names = class_names or self.class_names
-        if len(class_names) == 1:
-            class_names = ["background"] + class_names
+        class_names = _get_segmentation_class_names(class_names or self.class_names)
         color_mapping = color_mapping or generate_color_mapping(len(class_names))
 
         return overlay_segmentation(
-            image=image, pred_mask=self.prediction, num_classes=len(class_names), alpha=alpha, colors=color_mapping, class_names=class_names
+            image=self.image, pred_mask=self.prediction, num_classes=len(class_names), alpha=alpha, colors=color_mapping, class_names=class_names
         )
 
     def show(self, alpha: float = 0.6, color_mapping: Optional[List[Tuple[int, int, int]]] = None) -> None:
@@ -370,6 +533,42 @@ class ImagesPredictions(ABC):
     def __iter__(self) -> Iterator[ImagePrediction]:
         return iter(self._images_prediction_lst)
 
+    def _get_default_color_mapping(self) -> Optional[List[Tuple[int, int, int]]]:
+        """Generate the default color mapping once for all the images, instead of once per image.
+        All the images share the same class names, so the first one is used as reference.
+        """
+        if len(self._images_prediction_lst) == 0:
+            return None
+        return generate_color_mapping(len(self._get_class_names_to_color(self._images_prediction_lst[0].class_names)))
+
+    @staticmethod
+    def _get_class_names_to_color(class_names: List[str]) -> List[str]:
+        """Get the class names which are given a color in the default color mapping. Can be overridden to add implicit classes."""
+        return class_names
+
+    def _save_in_parallel(self, output_folder: str, num_workers: int, per_image_save_kwargs: Optional[List[Dict[str, Any]]] = None, **save_kwargs) -> None:
+        """Save every image prediction as "pred_{i}.jpg" in the output folder, drawing and saving the images in parallel threads.
+        The first exception raised while saving an image is re-raised.
+
+        :param output_folder:           Folder path, where the images will be saved.
+        :param num_workers:             Number of threads used to draw and save the images in parallel.
+        :param per_image_save_kwargs:   (Optional) Arguments passed to the `save` method of each image prediction, one dict per image.
+        :param save_kwargs:             Arguments passed to the `save` method of all the image predictions.
+        """
+        if output_folder:
+            os.makedirs(output_folder, exist_ok=True)
+
+        if per_image_save_kwargs is None:
+            per_image_save_kwargs = [{} for _ in range(len(self._images_prediction_lst))]
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(prediction.save, output_path=os.path.join(output_folder, f"pred_{i}.jpg"), **save_kwargs, **image_save_kwargs)
+                for i, (prediction, image_save_kwargs) in enumerate(zip(self._images_prediction_lst, per_image_save_kwargs))
+            ]
+            for future in futures:
+                future.result()
+
     @abstractmethod
     def show(self, *args, **kwargs) -> None:
         """Display the predictions on the images."""
@@ -420,18 +619,14 @@ class ImagesClassificationPrediction(ImagesPredictions):
         for prediction in self._images_prediction_lst:
             prediction.show(show_confidence=show_confidence)
 
-    def save(self, output_folder: str, show_confidence: bool = True) -> None:
+    def save(self, output_folder: str, show_confidence: bool = True, num_workers: int = _DEFAULT_SAVE_NUM_WORKERS) -> None:
         """Save the predicted label on the images.
 
         :param output_folder:     Folder path, where the images will be saved.
         :param show_confidence: Whether to show confidence scores on the image.
+        :param num_workers:     Number of threads used to draw and save the images in parallel.
         """
-        if output_folder:
-            os.makedirs(output_folder, exist_ok=True)
-
-        for i, prediction in enumerate(self._images_prediction_lst):
-            image_output_path = os.path.join(output_folder, f"pred_{i}.jpg")
-            prediction.save(output_path=image_output_path, show_confidence=show_confidence)
+        self._save_in_parallel(output_folder=output_folder, num_workers=num_workers, show_confidence=show_confidence)
 
 
 @dataclass
@@ -471,6 +666,8 @@ class ImagesDetectionPrediction(ImagesPredictions):
         :param class_names:             List of class names to show. By default, is None which shows all classes using during training.
         """
         target_bboxes, target_class_ids = self._check_target_args(target_bboxes, target_bboxes_format, target_class_ids)
+        target_bboxes, target_bboxes_format = self._convert_target_bboxes_to_xyxy(target_bboxes, target_bboxes_format)
+        color_mapping = color_mapping or self._get_default_color_mapping()
 
         for prediction, target_bbox, target_class_id in zip(self._images_prediction_lst, target_bboxes, target_class_ids):
             prediction.show(
@@ -483,6 +680,34 @@ class ImagesDetectionPrediction(ImagesPredictions):
                 class_names=class_names,
             )
 
+    def _convert_target_bboxes_to_xyxy(
+        self, target_bboxes: List[Optional[np.ndarray]], target_bboxes_format: Optional[str]
+    ) -> Tuple[List[Optional[np.ndarray]], Optional[str]]:
+        """Convert the target bboxes of all the images to xyxy format in a single call, instead of once per image.
+        Since some formats depend on the image shape, this is only done when all the images have the same shape.
+        Otherwise, the target bboxes are returned as is and will be converted per image.
+
+        :param target_bboxes:           List of target bboxes of each image, as returned by _check_target_args.
+        :param target_bboxes_format:    Format of the target bboxes.
+        :return:                        Tuple of the (possibly converted) target bboxes of each image and their format.
+        """
+        if target_bboxes_format is None or target_bboxes_format == "xyxy":
+            return target_bboxes, target_bboxes_format
+
+        image_shapes = {tuple(prediction.prediction.image_shape) for prediction in self._images_prediction_lst}
+        if len(image_shapes) != 1:
+            return target_bboxes, target_bboxes_format
+
+        target_bboxes_xyxy = convert_bboxes(
+            bboxes=np.concatenate(target_bboxes, axis=0),
+            image_shape=image_shapes.pop(),
+            source_format=_BBOX_FORMAT_FACTORY.get(target_bboxes_format),
+            target_format=_BBOX_FORMAT_FACTORY.get("xyxy"),
+            inplace=False,
+        )
+        split_indices = np.cumsum([len(image_target_bboxes) for image_target_bboxes in target_bboxes])[:-1]
+        return np.split(target_bboxes_xyxy, split_indices), "xyxy"
+
     def _check_target_args(
         self,
         target_bboxes: Optional[Union[np.ndarray, List[np.ndarray]]] = None,
@@ -523,6 +748,7 @@ class ImagesDetectionPrediction(ImagesPredictions):
         target_bboxes_format: Optional[str] = None,
         target_class_ids: Optional[Union[np.ndarray, List[np.ndarray]]] = None,
         class_names: Optional[List[str]] = None,
+        num_workers: int = _DEFAULT_SAVE_NUM_WORKERS,
     ) -> None:
         """Save the predicted bboxes on the images.
 
@@ -541,21 +767,24 @@ class ImagesDetectionPrediction(ImagesPredictions):
                                         ['xyxy','xywh', 'yxyx' 'cxcywh' 'normalized_xyxy' 'normalized_xywh', 'normalized_yxyx', 'normalized_cxcywh'].
                                         Will raise an error if not None and target_bboxes is None.
         :param class_names:             List of class names to show. By default, is None which shows all classes using during training.
+        :param num_workers:             Number of threads used to draw and save the images in parallel.
         """
-        if output_folder:
-            os.makedirs(output_folder, exist_ok=True)
-
         target_bboxes, target_class_ids = self._check_target_args(target_bboxes, target_bboxes_format, target_class_ids)
-
-        for i, (prediction, target_bbox, target_class_id) in enumerate(zip(self._images_prediction_lst, target_bboxes, target_class_ids)):
-            image_output_path = os.path.join(output_folder, f"pred_{i}.jpg")
-            prediction.save(
-                output_path=image_output_path,
-                box_thickness=box_thickness,
-                show_confidence=show_confidence,
-                color_mapping=color_mapping,
-                class_names=class_names,
-            )
+        target_bboxes, target_bboxes_format = self._convert_target_bboxes_to_xyxy(target_bboxes, target_bboxes_format)
+        color_mapping = color_mapping or self._get_default_color_mapping()
+
+        self._save_in_parallel(
+            output_folder=output_folder,
+            num_workers=num_workers,
+            per_image_save_kwargs=[
+                dict(target_bboxes=target_bbox, target_class_ids=target_class_id) for target_bbox, target_class_id in zip(target_bboxes, target_class_ids)
+            ],
+            box_thickness=box_thickness,
+            show_confidence=show_confidence,
+            color_mapping=color_mapping,
+            target_bboxes_format=target_bboxes_format,
+            class_names=class_names,
+        )
 
 
 @dataclass
@@ -576,25 +805,131 @@ class VideoDetectionPrediction(VideoPredictions):
         show_confidence: bool = True,
         color_mapping: Optional[List[Tuple[int, int, int]]] = None,
         class_names: Optional[List[str]] = None,
+        num_frame_buffers: int = 0,
     ) -> Iterator[np.ndarray]:
         """Draw the predicted bboxes on the images.
 
+        :param box_thickness:       (Optional) Thickness of bounding boxes. If None, will adapt to the box size.
+        :param show_confidence:     Whether to show confidence scores on the image.
+        :param color_mapping:       List of tuples representing the colors for each class.
+                                    Default is None, which generates a default color mapping based on the number of class names.
+        :param class_names:         List of class names to show. By default, is None which shows all classes using during training.
+        :param num_frame_buffers:   If > 0, the frames are drawn in turn in this number of preallocated buffers, instead of newly allocated images.
+                                    Each frame is then overwritten num_frame_buffers frames later, so it should be consumed before that.
+        :return:                    Iterable object of images with predicted bboxes. Note that this does not modify the original image.
+        """
+        frame_buffers = []
+
+        def _get_frame_buffer(frame_index: int, image: np.ndarray) -> Optional[np.ndarray]:
+            if num_frame_buffers <= 0:
+                return None
+            # The buffers are allocated on first use, and replaced (not overwritten) if the frame shape changes.
+            buffer_index = frame_index % num_frame_buffers
+            if buffer_index == len(frame_buffers):
+                frame_buffers.append(np.empty_like(image))
+            elif frame_buffers[buffer_index].shape != image.shape:
+                frame_buffers[buffer_index] = np.empty_like(image)
+            return frame_buffers[buffer_index]
+
+        return self._draw_frames(
+            get_out=_get_frame_buffer,
+            box_thickness=box_thickness,
+            show_confidence=show_confidence,
+            color_mapping=color_mapping,
+            class_names=class_names,
+        )
+
+    def iter_drawn_into(
+        self,
+        buf: np.ndarray,
+        box_thickness: Optional[int] = None,
+        show_confidence: bool = True,
+        color_mapping: Optional[List[Tuple[int, int, int]]] = None,
+        class_names: Optional[List[str]] = None,
+    ) -> Iterator[None]:
+        """Draw the predicted bboxes of every frame into a buffer owned by the caller, yielding once each frame is drawn.
+
+        This allows writing the frames directly from the caller's buffer (e.g. the staging buffer of a video writer) without any additional copy.
+        Each frame is overwritten by the next one, so it should be consumed before resuming the iteration.
+
+        :param buf:             Preallocated array with the same shape and dtype as the frames of the video, in which every frame is drawn.
+                                It can be any view, e.g. a BGR staging buffer viewed as RGB with `staging[..., ::-1]`,
+                                but the frames are only drawn without an intermediate copy when it is C-contiguous.
         :param box_thickness:   (Optional) Thickness of bounding boxes. If None, will adapt to the box size.
         :param show_confidence: Whether to show confidence scores on the image.
         :param color_mapping:   List of tuples representing the colors for each class.
                                 Default is None, which generates a default color mapping based on the number of class names.
         :param class_names:     List of class names to show. By default, is None which shows all classes using during training.
-        :return:                Iterable object of images with predicted bboxes. Note that this does not modify the original image.
+        :return:                Iterator yielding None once the current frame was drawn into `buf`.
+        """
+
+        def _get_buf(frame_index: int, image: np.ndarray) -> np.ndarray:
+            if image.shape != buf.shape:
+                raise ValueError(f"The buffer shape {buf.shape} does not match the shape of the video frames {image.shape}.")
+            return buf
+
+        for _ in self._draw_frames(
+            get_out=_get_buf,
+            box_thickness=box_thickness,
+            show_confidence=show_confidence,
+            color_mapping=color_mapping,
+            class_names=class_names,
+        ):
+            yield
+
+    def _draw_frames(
+        self,
+        get_out: Callable[[int, np.ndarray], Optional[np.ndarray]],
+        box_thickness: Optional[int],
+        show_confidence: bool,
+        color_mapping: Optional[List[Tuple[int, int, int]]],
+        class_names: Optional[List[str]],
+    ) -> Iterator[np.ndarray]:
+        """Draw the predicted bboxes on the frames, each one in the output array given by `get_out`.
+
+        :param get_out: Function taking the frame index and the frame image, and returning the array in which the frame is drawn.
+                        If it returns None, the frame is drawn in a newly allocated image.
+        :return:        Iterator of the drawn frames.
         """
+        # The color mapping is converted once per video to the lookup table used by ImageDetectionPrediction.draw.
+        color_lut = None if color_mapping is None else np.asarray(color_mapping, dtype=np.uint8)
+
+        # The next frames are predicted in a background thread while the current one is drawn.
+        images_predictions = _iterate_in_background(self._images_prediction_gen, max_queue_size=_PREDICTIONS_PREFETCH_SIZE)
+        for i, result in enumerate(tqdm(images_predictions, total=self.n_frames, desc="Processing Video")):
+            if color_lut is None:
+                color_lut = np.asarray(generate_color_mapping(len(result.class_names)), dtype=np.uint8)
 
-        for result in tqdm(self._images_prediction_gen, total=self.n_frames, desc="Processing Video"):
             yield result.draw(
                 box_thickness=box_thickness,
                 show_confidence=show_confidence,
-                color_mapping=color_mapping,
+                color_mapping=color_lut,
                 class_names=class_names,
+                out=get_out(i, result.image),
             )
 
+    def _draw_frames_in_background(
+        self,
+        box_thickness: Optional[int],
+        show_confidence: bool,
+        color_mapping: Optional[List[Tuple[int, int, int]]],
+        class_names: Optional[List[str]],
+    ) -> Iterator[np.ndarray]:
+        """Draw the predicted bboxes on the frames in a background thread, in a ring of reused frame buffers.
+
+        :return: Iterator of the drawn frames. Each frame is overwritten a few frames later, so it should be consumed (e.g. encoded) before that.
+        """
+        # With one buffer per frame waiting in the queue, plus one for the frame being consumed and one for the frame being drawn,
+        # a buffer is never overwritten before its frame is consumed.
+        frames = self.draw(
+            box_thickness=box_thickness,
+            show_confidence=show_confidence,
+            color_mapping=color_mapping,
+            class_names=class_names,
+            num_frame_buffers=_VIDEO_PIPELINE_QUEUE_SIZE + 2,
+        )
+        return _iterate_in_background(frames, max_queue_size=_VIDEO_PIPELINE_QUEUE_SIZE)
+
     def show(
         self,
         box_thickness: Optional[int] = None,
@@ -610,7 +945,10 @@ class VideoDetectionPrediction(VideoPredictions):
                                 Default is None, which generates a default color mapping based on the number of class names.
         :param class_names:     List of class names to show. By default, is None which shows all classes using during training.
         """
-        frames = self.draw(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping, class_names=class_names)
+        # Frames are drawn in a background thread while the previous ones are displayed.
+        frames = self._draw_frames_in_background(
+            box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping, class_names=class_names
+        )
         show_video_from_frames(window_name="Detection", frames=frames, fps=self.fps)
 
     def save(
@@ -630,7 +968,10 @@ class VideoDetectionPrediction(VideoPredictions):
                                 Default is None, which generates a default color mapping based on the number of class names.
         :param class_names:     List of class names to show. By default, is None which shows all classes using during training.
         """
-        frames = self.draw(box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping, class_names=class_names)
+        # Frames are drawn in a background thread while the previous ones are encoded.
+        frames = self._draw_frames_in_background(
+            box_thickness=box_thickness, show_confidence=show_confidence, color_mapping=color_mapping, class_names=class_names
+        )
         save_video(output_path=output_path, frames=frames, fps=self.fps)
 
 
@@ -643,28 +984,29 @@ class ImagesSegmentationPrediction(ImagesPredictions):
 
     _images_prediction_lst: List[ImageSegmentationPrediction]
 
+    # Binary segmentation models have an implicit background class, which is also given a color.
+    _get_class_names_to_color = staticmethod(_get_segmentation_class_names)
+
     def show(self, color_mapping: Optional[List[Tuple[int, int, int]]] = None) -> None:
         """Display the predicted segmentation on the images.
 
         :param color_mapping:   List of tuples representing the colors for each class.
                                 Default is None, which generates a default color mapping based on the number of class names.
         """
+        color_mapping = color_mapping or self._get_default_color_mapping()
         for prediction in self._images_prediction_lst:
             prediction.show(color_mapping=color_mapping)
 
-    def save(self, output_folder: str, color_mapping: Optional[List[Tuple[int, int, int]]] = None) -> None:
+    def save(self, output_folder: str, color_mapping: Optional[List[Tuple[int, int, int]]] = None, num_workers: int = _DEFAULT_SAVE_NUM_WORKERS) -> None:
         """Save the predicted bboxes on the images.
 
         :param output_folder:     Folder path, where the images will be saved.
         :param color_mapping:   List of tuples representing the colors for each class.
                                 Default is None, which generates a default color mapping based on the number of class names.
+        :param num_workers:     Number of threads used to draw and save the images in parallel.
         """
-        if output_folder:
-            os.makedirs(output_folder, exist_ok=True)
-
-        for i, prediction in enumerate(self._images_prediction_lst):
-            image_output_path = os.path.join(output_folder, f"pred_{i}.jpg")
-            prediction.save(output_path=image_output_path, color_mapping=color_mapping)
+        color_mapping = color_mapping or self._get_default_color_mapping()
+        self._save_in_parallel(output_folder=output_folder, num_workers=num_workers, color_mapping=color_mapping)
 
 
 @dataclass
@@ -678,17 +1020,70 @@ class VideoSegmentationPrediction(VideoPredictions):
     _images_prediction_lst: List[ImageSegmentationPrediction]
     fps: int
 
-    def draw(self, alpha: float = 0.6, color_mapping: Optional[List[Tuple[int, int, int]]] = None, class_names: Optional[List[str]] = None) -> List[np.ndarray]:
+    def draw(
+        self, alpha: float = 0.6, color_mapping: Optional[List[Tuple[int, int, int]]] = None, class_names: Optional[List[str]] = None
+    ) -> Iterator[np.ndarray]:
         """Draw the predicted segmentation on the images.
 
         :param alpha:           Float number between [0,1] denoting the transparency of the masks (0 means full transparency, 1 means opacity).
         :param color_mapping:   List of tuples representing the colors for each class.
                                 Default is None, which generates a default color mapping based on the number of class names.
         :param class_names:     List of class names to predict (segmentation classes).
-        :return:                List of images with predicted segmentation. Note that this does not modify the original image.
+        :return:                Iterable object of images with predicted segmentation. Note that this does not modify the original image.
+        """
+        if color_mapping is None and len(self._images_prediction_lst) > 0:
+            color_mapping = generate_color_mapping(len(_get_segmentation_class_names(class_names or self._images_prediction_lst[0].class_names)))
+
+        for result in self._images_prediction_lst:
+            yield result.draw(alpha=alpha, color_mapping=color_mapping, class_names=class_names)
+
+    def draw_batched(
+        self,
+        alpha: float = 0.6,
+        color_mapping: Optional[List[Tuple[int, int, int]]] = None,
+        class_names: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        """Draw the predicted segmentation on the images, blending batches of frames on the GPU.
+        The frames are identical to the ones of `draw`, which is used when CUDA is not available.
+
+        :param alpha:           Float number between [0,1] denoting the transparency of the masks (0 means full transparency, 1 means opacity).
+        :param color_mapping:   List of tuples representing the colors for each class.
+                                Default is None, which generates a default color mapping based on the number of class names.
+        :param class_names:     List of class names to predict (segmentation classes).
+        :param batch_size:      Number of frames blended together on the GPU.
+                                Default is None, which fits the batch in a fixed GPU memory budget given the frame resolution.
+        :return:                Iterable object of images with predicted segmentation. Note that this does not modify the original image.
         """
-        frames_with_segmentation = [result.draw(alpha=alpha, color_mapping=color_mapping, class_names=class_names) for result in self._images_prediction_lst]
-        return frames_with_segmentation
+        if not torch.cuda.is_available() or len(self._images_prediction_lst) == 0:
+            yield from self.draw(alpha=alpha, color_mapping=color_mapping, class_names=class_names)
+            return
+
+        class_names = _get_segmentation_class_names(class_names or self._images_prediction_lst[0].class_names)
+        color_mapping = color_mapping or generate_color_mapping(len(class_names))
+        color_lut = torch.as_tensor(get_color_lut(color_mapping), device="cuda")
+
+        if batch_size is None:
+            first_result = self._images_prediction_lst[0]
+            # Per pixel: the uploaded image and segmentation map, the int32 indices, and the two int16 buffers of blend_segmentation_batch.
+            bytes_per_pixel = first_result.image.shape[2] * (1 + 2 + 2) + first_result.prediction.segmentation_map.itemsize + 4
+            batch_size = max(1, _SEGMENTATION_BLEND_GPU_MEMORY // (first_result.image.shape[0] * first_result.image.shape[1] * bytes_per_pixel))
+
+        for i in range(0, len(self._images_prediction_lst), batch_size):
+            batch = self._images_prediction_lst[i : i + batch_size]
+            images = torch.as_tensor(np.stack([result.image for result in batch]), device="cuda")
+            segmentation_maps = torch.as_tensor(np.stack([result.prediction.segmentation_map for result in batch]), device="cuda").int()
+            blended_images = blend_segmentation_batch(images=images, segmentation_maps=segmentation_maps, color_lut=color_lut, alpha=alpha).cpu().numpy()
+            # The GPU buffers are freed before the frames are consumed, instead of when the next batch is allocated.
+            del images, segmentation_maps
+
+            for result, blended_image in zip(batch, blended_images):
+                yield add_segmentation_legend(
+                    segmentation_prediction=blended_image,
+                    segmentation_map=result.prediction.segmentation_map,
+                    colors=color_mapping,
+                    class_names=class_names,
+                )
 
     def show(self, alpha: float = 0.6, color_mapping: Optional[List[Tuple[int, int, int]]] = None, class_names: Optional[List[str]] = None) -> None:
         """Display the predicted segmentation on the images.
@@ -698,8 +1093,9 @@ class VideoSegmentationPrediction(VideoPredictions):
                                 Default is None, which generates a default color mapping based on the number of class names.
         :param class_names:     List of class names to predict (segmentation classes).
         """
+        # Frames are drawn in a background thread while the previous ones are displayed.
         frames = self.draw(alpha=alpha, color_mapping=color_mapping, class_names=class_names)
-        show_video_from_frames(window_name="Segmentation", frames=frames, fps=self.fps)
+        show_video_from_frames(window_name="Segmentation", frames=_iterate_in_background(frames), fps=self.fps)
 
     def save(
         self, output_path: str, alpha: float = 0.6, color_mapping: Optional[List[Tuple[int, int, int]]] = None, class_names: Optional[List[str]] = None
@@ -712,5 +1108,6 @@ class VideoSegmentationPrediction(VideoPredictions):
                                 Default is None, which generates a default color mapping based on the number of class names.
         :param class_names:     List of class names to predict (segmentation classes).
         """
+        # Frames are drawn in a background thread while the previous ones are encoded.
         frames = self.draw(alpha=alpha, color_mapping=color_mapping, class_names=class_names)
-        save_video(output_path=output_path, frames=frames, fps=self.fps)
+        save_video(output_path=output_path, frames=_iterate_in_background(frames), fps=self.fps)
@@ -14,6 +14,7 @@ def draw_bbox(
     y1: int,
     x2: int,
     y2: int,
+    inplace: bool = False,
 ) -> np.ndarray:
     """Draw a bounding box on an image.
 
@@ -25,24 +26,73 @@ def draw_bbox(
     :param y1:              y-coordinate of the top-left corner of the bounding box.
     :param x2:              x-coordinate of the bottom-right corner of the bounding box.
     :param y2:              y-coordinate of the bottom-right corner of the bounding box.
+    :param inplace:         If True, draw directly on the input image. Otherwise, draw on a copy of it.
+    :return:                Image with the bounding box.
     """
 
     if box_thickness is None:
         box_thickness = get_recommended_box_thickness(x1=x1, y1=y1, x2=x2, y2=y2)
 
+    if not inplace:
+        image = image.copy()
+    elif not _is_writable_by_opencv(image):
+        # OpenCV cannot write in this layout (e.g. Fortran order, or reversed channels), so the bbox is drawn on a copy which is then copied back.
+        drawn_image = draw_bbox(
+            image=np.ascontiguousarray(image), title=title, color=color, box_thickness=box_thickness, x1=x1, y1=y1, x2=x2, y2=y2, inplace=True
+        )
+        np.copyto(image, drawn_image)
+        return image
+
+    # Adapt font size to image shape.
+    # This is required because small images require small font size, but this makes the title look bad,
+    # so when possible we increase the font size to a more appropriate value.
+    font_size = get_recommended_text_size(x1=x1, y1=y1, x2=x2, y2=y2)
+
+    # Blending the overlay has no effect outside of the region covered by the box and its title,
+    # so we only work on this region instead of the whole image.
+    (text_width, text_height), baseline = cv2.getTextSize(title, 2, font_size, 1)
+    margin = box_thickness + baseline + 2
+    roi_x1 = max(min(x1, x2) - margin, 0)
+    roi_y1 = max(min(y1, y2) - text_height - int(15 * font_size) - margin, 0)
+    roi_x2 = min(max(x2, x1 + text_width + 7) + margin, image.shape[1])
+    roi_y2 = min(max(y1, y2) + margin, image.shape[0])
+    if roi_x1 >= roi_x2 or roi_y1 >= roi_y2:
+        return image
+
+    roi = image[roi_y1:roi_y2, roi_x1:roi_x2]
+    x1, y1, x2, y2 = x1 - roi_x1, y1 - roi_y1, x2 - roi_x1, y2 - roi_y1
+
     # Draw bbox
-    overlay = image.copy()
+    overlay = roi.copy()
     overlay = cv2.rectangle(overlay, (x1, y1), (x2, y2), color, box_thickness)
 
     if title is not None or title != "":
-        # Adapt font size to image shape.
-        # This is required because small images require small font size, but this makes the title look bad,
-        # so when possible we increase the font size to a more appropriate value.
-
-        font_size = get_recommended_text_size(x1=x1, y1=y1, x2=x2, y2=y2)
         overlay = draw_text_box(image=overlay, text=title, x=x1, y=y1, font=2, font_size=font_size, background_color=color, thickness=1)
 
-    return cv2.addWeighted(overlay, 0.75, image, 0.25, 0)
+    # The blending leaves unchanged the pixels that were not drawn on, i.e. the inside of the box.
+    # So for large boxes we only blend the bands around the edges and the title, instead of the whole region.
+    top, bottom, left, right = y1 + margin + 1, y2 - margin, x1 + margin + 1, x2 - margin
+    if x1 <= x2 and y1 <= y2 and top < bottom and left < right:
+        top, bottom, left, right = max(top, 0), max(bottom, 0), max(left, 0), max(right, 0)
+        bands = [np.s_[:top], np.s_[bottom:], np.s_[top:bottom, :left], np.s_[top:bottom, right:]]
+    else:
+        bands = [np.s_[:]]
+
+    for band in bands:
+        roi_band = roi[band]
+        if roi_band.size > 0:
+            cv2.addWeighted(overlay[band], 0.75, roi_band, 0.25, 0, dst=roi_band)
+    return image
+
+
+def _is_writable_by_opencv(image: np.ndarray) -> bool:
+    """Check whether OpenCV can write in an image in place, i.e. the pixels of each row are contiguous and the rows are in increasing memory order.
+    This is the case of C-contiguous images and of their crops, but not of images in Fortran order or with reversed channels.
+    """
+    if image.size == 0:
+        return True
+    row = image[0]
+    return row.flags.c_contiguous and image.strides[0] >= row.nbytes
 
 
 def get_recommended_box_thickness(x1: int, y1: int, x2: int, y2: int) -> int:
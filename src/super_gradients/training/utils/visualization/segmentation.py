@@ -1,9 +1,10 @@
+import cv2
 import numpy as np
 import torch
-from torchvision.utils import draw_segmentation_masks
+from PIL import ImageColor
 from typing import List, Optional, Tuple, Union, Set
-from super_gradients.training.utils.segmentation_utils import to_one_hot
 from super_gradients.training.utils.visualization.legend import draw_legend_on_canvas
+from super_gradients.training.utils.visualization.utils import generate_color_mapping
 
 
 def overlay_segmentation(
@@ -20,27 +21,145 @@ def overlay_segmentation(
     :param pred_mask:           Image on which to draw the segmentation.
     :param num_classes:           Image on which to draw the segmentation.
     :param alpha:           Float number between [0,1] denoting the transparency of the masks (0 means full transparency, 1 means opacity).
-    :param colors:           List containing the colors of the masks or single color for all masks. By default, random colors are generated for each mask.
+    :param colors:           List containing the colors of the masks or single color for all masks. By default, a color is generated for each mask.
     :param class_names:           List containing the class names of cityscapes classes used for model training
     """
+    if colors is None:
+        colors = generate_color_mapping(num_classes)
+    elif isinstance(colors, (str, tuple)):
+        colors = [colors] * num_classes
 
-    overlay = image.copy()
-    overlay = torch.from_numpy(overlay.transpose(2, 0, 1))  # torch.from_numpy(overlay.astype(np.uint8)*255)
-    segmentation_mask = torch.from_numpy(np.expand_dims(pred_mask.segmentation_map, axis=0))
-    one_hot_prediction_masks = to_one_hot(target=segmentation_mask, num_classes=num_classes)  # , ignore_index: int = None)
-    segmentation_overlay = draw_segmentation_masks(overlay, masks=one_hot_prediction_masks.squeeze(0).bool(), alpha=alpha, colors=colors)
+    segmentation_map = pred_mask.segmentation_map
+    legend = _draw_segmentation_legend(image=image, segmentation_map=segmentation_map, colors=colors, class_names=class_names)
 
-    segmentation_prediction = np.array(segmentation_overlay.detach().permute(1, 2, 0))
+    # The legend only depends on the image width, so the output can be allocated before blending,
+    # and the segmentation is blended directly above the legend instead of being concatenated with it afterwards.
+    height, width = image.shape[:2]
+    segmentation_prediction = np.empty((height + legend.shape[0], width, 3), dtype=np.uint8)
+    segmentation_prediction[height:] = legend
+    out = segmentation_prediction[:height]
+    blended = blend_segmentation(image=image, segmentation_map=segmentation_map, color_lut=get_color_lut(colors), alpha=alpha, out=out)
+    if blended is not out:
+        # OpenCV allocates a new output instead of writing in `out` when it cannot be used as is.
+        out[...] = blended
 
+    return segmentation_prediction
+
+
+def blend_segmentation(image: np.ndarray, segmentation_map: np.ndarray, color_lut: np.ndarray, alpha: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Blend the color of the class of every pixel with the image.
+
+    The blending is done in fixed-point arithmetic (alpha is quantized to 1/256), i.e. `(image * (256 - alpha) + color * alpha) >> 8`,
+    which avoids building a one-hot mask per class and the float intermediates of a float blending.
+
+    :param image:               Image on which to blend the segmentation, of shape (H, W, 3).
+    :param segmentation_map:    Segmentation map, of shape (H, W), where each pixel is the id of its class.
+    :param color_lut:           Lookup table of the class colors, of shape (num_classes, 3) and dtype uint8, as returned by `get_color_lut`.
+    :param alpha:               Float number between [0,1] denoting the transparency of the masks (0 means full transparency, 1 means opacity).
+    :param out:                 (Optional) Preallocated uint8 array with the same shape as the image, in which the result is written.
+    :return:                    Image with the segmentation blended, of dtype uint8. This is `out` if given, unless OpenCV could not write in it as is.
+    """
+    if image.dtype == np.uint8 and len(color_lut) <= 256:
+        return _blend_segmentation_cv2(image=image, segmentation_map=segmentation_map, color_lut=color_lut, alpha=alpha, out=out)
+    return _blend_segmentation_numpy(image=image, segmentation_map=segmentation_map, color_lut=color_lut, alpha=alpha, out=out)
+
+
+def _blend_segmentation_cv2(image: np.ndarray, segmentation_map: np.ndarray, color_lut: np.ndarray, alpha: float, out: Optional[np.ndarray]) -> np.ndarray:
+    """Blend the segmentation with OpenCV, for uint8 images and up to 256 classes. See `blend_segmentation`."""
+    alpha_q = int(round(alpha * 256))
+
+    # The colors are gathered by cv2.LUT and blended by cv2.addWeighted, both in a single SIMD pass.
+    segmentation_map_u8 = segmentation_map.astype(np.uint8, copy=False)
+    lut = np.zeros((256, 1, 3), dtype=np.uint8)
+    lut[: len(color_lut), 0] = color_lut
+    colored_mask = cv2.LUT(cv2.merge((segmentation_map_u8, segmentation_map_u8, segmentation_map_u8)), lut)
+    # cv2.addWeighted rounds to the nearest integer. Offsetting by (-0.5 + 1/512) makes it round down like the fixed-point blending,
+    # since the blended values are multiples of 1/256.
+    return cv2.addWeighted(np.ascontiguousarray(image), (256 - alpha_q) / 256, colored_mask, alpha_q / 256, -0.5 + 1 / 512, dst=out)
+
+
+def _blend_segmentation_numpy(image: np.ndarray, segmentation_map: np.ndarray, color_lut: np.ndarray, alpha: float, out: Optional[np.ndarray]) -> np.ndarray:
+    """Blend the segmentation with NumPy, for any image dtype and number of classes. See `blend_segmentation`."""
+    alpha_q = int(round(alpha * 256))
+
+    # The colors are weighted by alpha in the lookup table, and the blending is done in place in a single buffer.
+    blended = image.astype(np.uint16)
+    blended *= 256 - alpha_q
+    blended += np.take(color_lut.astype(np.uint16) * alpha_q, segmentation_map, axis=0)
+    blended >>= 8
+    if out is None:
+        return blended.astype(np.uint8)
+    np.copyto(out, blended, casting="unsafe")
+    return out
+
+
+def blend_segmentation_batch(images: torch.Tensor, segmentation_maps: torch.Tensor, color_lut: torch.Tensor, alpha: float) -> torch.Tensor:
+    """Blend the color of the class of every pixel with a batch of images, in place and with the same result as `blend_segmentation`.
+
+    The blending `image + floor((color - image) * alpha / 256)` is done in int16, which halves the memory of an int32 blending:
+    since the differences are at most 255 in absolute value, it is computed as `image + floor((diff * (alpha // 2) + (diff >> 1) * (alpha % 2)) / 128)`,
+    whose intermediates stay within the int16 range.
+
+    :param images:              Batch of uint8 images, of shape (N, H, W, 3). The blended images are written in this tensor.
+    :param segmentation_maps:   Batch of int32 or int64 segmentation maps, of shape (N, H, W), on the same device as the images.
+    :param color_lut:           Lookup table of the class colors, of shape (num_classes, 3), as returned by `get_color_lut`.
+    :param alpha:               Float number between [0,1] denoting the transparency of the masks (0 means full transparency, 1 means opacity).
+    :return:                    The images tensor, with the segmentation blended.
+    """
+    alpha_q = int(round(alpha * 256))
+
+    diff = torch.as_tensor(color_lut, device=images.device).to(torch.int16).index_select(0, segmentation_maps.reshape(-1)).view(images.shape)
+    diff.sub_(images)
+    if alpha_q % 2 == 1:
+        half_diff = diff >> 1
+        diff.mul_(alpha_q // 2).add_(half_diff)
+    else:
+        diff.mul_(alpha_q // 2)
+    diff >>= 7
+    diff.add_(images)
+    return images.copy_(diff)
+
+
+def add_segmentation_legend(
+    segmentation_prediction: np.ndarray,
+    segmentation_map: np.ndarray,
+    colors: List[Union[str, Tuple[int, int, int]]],
+    class_names: List[str],
+) -> np.ndarray:
+    """Add a legend of the classes that appear in the segmentation map below the image.
+
+    :param segmentation_prediction: Image with the segmentation overlay.
+    :param segmentation_map:        Segmentation map, of shape (H, W), where each pixel is the id of its class.
+    :param colors:                  List containing the colors of each class.
+    :param class_names:             List containing the class names of each class.
+    :return:                        Image with the legend below it.
+    """
+    legend = _draw_segmentation_legend(image=segmentation_prediction, segmentation_map=segmentation_map, colors=colors, class_names=class_names)
+    return np.concatenate((segmentation_prediction, legend), axis=0)
+
+
+def _draw_segmentation_legend(
+    image: np.ndarray,
+    segmentation_map: np.ndarray,
+    colors: List[Union[str, Tuple[int, int, int]]],
+    class_names: List[str],
+) -> np.ndarray:
+    """Draw the legend of the classes that appear in the segmentation map, on a canvas as wide as the image."""
     # Initialize an empty list to store the classes that appear in the image
+    class_pixel_counts = np.bincount(segmentation_map.ravel(), minlength=len(class_names))
     classes_in_image_with_color: Set[Tuple[str, Tuple]] = set()
 
     for idx, class_name in enumerate(class_names):
-        color = colors[idx]
-        if torch.any(one_hot_prediction_masks[0, idx, :, :]):
-            classes_in_image_with_color.add((class_name, color))
+        if class_pixel_counts[idx] > 0:
+            classes_in_image_with_color.add((class_name, colors[idx]))
 
-    canvas = draw_legend_on_canvas(image=segmentation_prediction, class_color_tuples=classes_in_image_with_color)
-    segmentation_prediction = np.concatenate((segmentation_prediction, canvas), axis=0)
+    return draw_legend_on_canvas(image=image, class_color_tuples=classes_in_image_with_color)
 
-    return segmentation_prediction
+
+def get_color_lut(colors: List[Union[str, Tuple[int, int, int]]]) -> np.ndarray:
+    """Build a color lookup table, to get the color of every pixel of a segmentation map with a single indexing operation.
+
+    :param colors:  Color of each class, either as an RGB tuple or as a color string (e.g. "red" or "#ff0000").
+    :return:        Lookup table of shape (num_classes, 3) and dtype uint8, where row i is the RGB color of class i.
+    """
+    return np.array([ImageColor.getrgb(color) if isinstance(color, str) else color for color in colors], dtype=np.uint8).reshape(-1, 3)
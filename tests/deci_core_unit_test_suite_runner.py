@@ -58,6 +58,8 @@ from tests.unit_tests.test_model_weight_averaging import TestModelWeightAveragin
 from tests.unit_tests.test_supports_check_input_shape import TestSupportsInputShapeCheck
 from tests.unit_tests.test_train_with_torch_scheduler import TrainWithTorchSchedulerTest
 from tests.unit_tests.test_version_check import TestVersionCheck
+from tests.unit_tests.test_prediction_results import TestPredictionResults
+from tests.unit_tests.test_visualization import TestVisualization
 from tests.unit_tests.test_yolo_nas_pose import YoloNASPoseTests
 from tests.unit_tests.train_with_intialized_param_args_test import TrainWithInitializedObjectsTest
 from tests.unit_tests.pretrained_models_unit_test import PretrainedModelsUnitTest
@@ -178,6 +180,8 @@ class CoreUnitTestSuiteRunner:
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(DynamicModelTests))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestConvertRecipeToCode))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestVersionCheck))
+        self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestPredictionResults))
+        self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestVisualization))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestModelWeightAveraging))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestClassificationAdapter))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestDetectionAdapter))
@@ -0,0 +1,272 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from typing import Iterator, List
+
+import cv2
+import numpy as np
+import torch
+
+from super_gradients.common.factories.bbox_format_factory import BBoxFormatFactory
+from super_gradients.training.datasets.data_formats.bbox_formats import convert_bboxes
+from super_gradients.training.utils.predict import ClassificationPrediction, DetectionPrediction, SegmentationPrediction
+from super_gradients.training.utils.predict.prediction_results import (
+    ImageClassificationPrediction,
+    ImageDetectionPrediction,
+    ImageSegmentationPrediction,
+    ImagesClassificationPrediction,
+    ImagesDetectionPrediction,
+    VideoDetectionPrediction,
+    VideoSegmentationPrediction,
+    _iterate_in_background,
+    _VIDEO_PIPELINE_QUEUE_SIZE,
+)
+
+
+class _ProducerInterrupt(BaseException):
+    pass
+
+
+class TestPredictionResults(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(seed=42)
+        self.class_names = ["class_{}".format(i) for i in range(5)]
+
+    def _get_image_detection_predictions(self, num_frames: int, height: int = 120, width: int = 160, min_num_boxes: int = 0) -> List[ImageDetectionPrediction]:
+        predictions = []
+        for _ in range(num_frames):
+            image = self.rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+            num_boxes = int(self.rng.integers(min_num_boxes, 6))
+            xy1 = self.rng.uniform(0, [width, height], size=(num_boxes, 2))
+            xy2 = xy1 + self.rng.uniform(5, 50, size=(num_boxes, 2))
+            prediction = DetectionPrediction(
+                bboxes=np.concatenate([xy1, xy2], axis=1).astype(np.float32),
+                bbox_format="xyxy",
+                confidence=self.rng.uniform(0, 1, size=num_boxes).astype(np.float32),
+                labels=self.rng.integers(0, len(self.class_names), size=num_boxes),
+                image_shape=(height, width),
+            )
+            predictions.append(ImageDetectionPrediction(image=image, prediction=prediction, class_names=self.class_names))
+        return predictions
+
+    def _get_video_detection_prediction(self, images_predictions: List[ImageDetectionPrediction]) -> VideoDetectionPrediction:
+        return VideoDetectionPrediction(_images_prediction_gen=iter(images_predictions), fps=10, n_frames=len(images_predictions))
+
+    def test_images_detection_convert_target_bboxes_to_xyxy(self):
+        images_prediction = ImagesDetectionPrediction(_images_prediction_lst=self._get_image_detection_predictions(num_frames=3, height=90, width=140))
+        factory = BBoxFormatFactory()
+
+        for target_bboxes_format in ("xywh", "cxcywh", "yxyx", "normalized_xyxy", "normalized_xywh", "normalized_cxcywh"):
+            # Some images with targets and some without, and no image with targets.
+            for num_targets in ((3, 0, 5), (0, 0, 0)):
+                target_bboxes = [self.rng.uniform(0, 1, size=(n, 4)) for n in num_targets]
+                converted_bboxes, converted_format = images_prediction._convert_target_bboxes_to_xyxy(target_bboxes, target_bboxes_format)
+
+                self.assertEqual(converted_format, "xyxy")
+                self.assertEqual(len(converted_bboxes), len(target_bboxes))
+                for image_target_bboxes, image_converted_bboxes in zip(target_bboxes, converted_bboxes):
+                    expected_bboxes = convert_bboxes(
+                        bboxes=image_target_bboxes,
+                        image_shape=(90, 140),
+                        source_format=factory.get(target_bboxes_format),
+                        target_format=factory.get("xyxy"),
+                        inplace=False,
+                    )
+                    np.testing.assert_allclose(image_converted_bboxes, expected_bboxes)
+
+    def test_images_detection_convert_target_bboxes_to_xyxy_skipped(self):
+        target_bboxes = [self.rng.uniform(0, 1, size=(2, 4)) for _ in range(2)]
+
+        # Already in xyxy format.
+        images_prediction = ImagesDetectionPrediction(_images_prediction_lst=self._get_image_detection_predictions(num_frames=2))
+        self.assertEqual(images_prediction._convert_target_bboxes_to_xyxy(target_bboxes, "xyxy"), (target_bboxes, "xyxy"))
+
+        # Images with different shapes are converted one by one by ImageDetectionPrediction.draw.
+        images_predictions = self._get_image_detection_predictions(num_frames=1) + self._get_image_detection_predictions(num_frames=1, height=50)
+        images_prediction = ImagesDetectionPrediction(_images_prediction_lst=images_predictions)
+        self.assertEqual(images_prediction._convert_target_bboxes_to_xyxy(target_bboxes, "normalized_xywh"), (target_bboxes, "normalized_xywh"))
+
+    def test_image_detection_draw_with_xyxy_target_bboxes(self):
+        image_prediction = self._get_image_detection_predictions(num_frames=1, height=500, width=400)[0]
+        target_bboxes = self.rng.uniform(0, 1, size=(4, 4))
+        target_class_ids = self.rng.integers(0, len(self.class_names), size=4)
+        target_bboxes_xyxy = convert_bboxes(
+            bboxes=target_bboxes,
+            image_shape=(500, 400),
+            source_format=BBoxFormatFactory().get("normalized_cxcywh"),
+            target_format=BBoxFormatFactory().get("xyxy"),
+            inplace=False,
+        )
+
+        expected_image = image_prediction.draw(target_bboxes=target_bboxes, target_bboxes_format="normalized_cxcywh", target_class_ids=target_class_ids)
+        drawn_image = image_prediction.draw(target_bboxes=target_bboxes_xyxy, target_bboxes_format="xyxy", target_class_ids=target_class_ids)
+        np.testing.assert_array_equal(drawn_image, expected_image)
+
+    def test_images_detection_save_with_target_bboxes(self):
+        images_prediction = ImagesDetectionPrediction(_images_prediction_lst=self._get_image_detection_predictions(num_frames=3, height=500, width=400))
+        target_bboxes = [self.rng.uniform(0, 1, size=(n, 4)) for n in (2, 0, 3)]
+        target_class_ids = [self.rng.integers(0, len(self.class_names), size=len(bboxes)) for bboxes in target_bboxes]
+
+        with tempfile.TemporaryDirectory() as tmp_dirname:
+            images_prediction.save(tmp_dirname, target_bboxes=target_bboxes, target_bboxes_format="normalized_xywh", target_class_ids=target_class_ids)
+            for i, image_prediction in enumerate(images_prediction):
+                saved_image = cv2.imread(os.path.join(tmp_dirname, f"pred_{i}.jpg"))
+                if len(target_bboxes[i]) > 0:
+                    # Predictions and ground truth side by side.
+                    self.assertGreater(saved_image.shape[1], 2 * image_prediction.image.shape[1])
+                else:
+                    self.assertEqual(saved_image.shape, image_prediction.image.shape)
+
+    def test_images_save_in_parallel(self):
+        images_predictions = [
+            ImageClassificationPrediction(
+                image=self.rng.integers(0, 256, size=(48, 64, 3), dtype=np.uint8),
+                prediction=ClassificationPrediction(confidence=0.9, label=1, image_shape=(48, 64)),
+                class_names=self.class_names,
+            )
+            for _ in range(5)
+        ]
+        images_prediction = ImagesClassificationPrediction(_images_prediction_lst=images_predictions)
+
+        with tempfile.TemporaryDirectory() as tmp_dirname:
+            output_folder = os.path.join(tmp_dirname, "predictions")
+            images_prediction.save(output_folder, num_workers=2)
+            self.assertEqual(sorted(os.listdir(output_folder)), [f"pred_{i}.jpg" for i in range(5)])
+
+            # An error raised while saving any of the images is propagated.
+            images_predictions[3].image = None
+            with self.assertRaises(Exception):
+                images_prediction.save(output_folder, num_workers=2)
+
+    def test_image_detection_draw_without_bboxes_to_show_returns_a_copy(self):
+        image_prediction = self._get_image_detection_predictions(num_frames=1, min_num_boxes=1)[0]
+        image_prediction.prediction.labels[:] = 1
+        original_image = image_prediction.image.copy()
+
+        # No bbox belongs to the classes to show, so the image is returned without any drawing.
+        drawn_image = image_prediction.draw(class_names=[self.class_names[0]])
+        self.assertIsNot(drawn_image, image_prediction.image)
+        self.assertFalse(np.shares_memory(drawn_image, image_prediction.image))
+        np.testing.assert_array_equal(drawn_image, original_image)
+        drawn_image[:] = 0
+        np.testing.assert_array_equal(image_prediction.image, original_image)
+
+        out = np.zeros_like(image_prediction.image)
+        self.assertIs(image_prediction.draw(class_names=[self.class_names[0]], out=out), out)
+        np.testing.assert_array_equal(out, original_image)
+        out[:] = 0
+        np.testing.assert_array_equal(image_prediction.image, original_image)
+
+    def test_image_detection_draw_into_non_contiguous_out(self):
+        image_prediction = self._get_image_detection_predictions(num_frames=1, min_num_boxes=1)[0]
+        expected_image = image_prediction.draw()
+
+        shape = image_prediction.image.shape
+        for out in (np.empty(shape, dtype=np.uint8, order="F"), np.empty(shape, dtype=np.uint8)[..., ::-1]):
+            self.assertIs(image_prediction.draw(out=out), out)
+            np.testing.assert_array_equal(out, expected_image)
+
+    def test_video_detection_iter_drawn_into_matches_draw(self):
+        images_predictions = self._get_image_detection_predictions(num_frames=5)
+        expected_frames = list(self._get_video_detection_prediction(images_predictions).draw())
+
+        # A C-contiguous buffer, and a BGR staging buffer viewed as RGB.
+        for buf in (np.empty_like(images_predictions[0].image), np.empty_like(images_predictions[0].image)[..., ::-1]):
+            drawn_frames = [buf.copy() for _ in self._get_video_detection_prediction(images_predictions).iter_drawn_into(buf)]
+
+            self.assertEqual(len(drawn_frames), len(expected_frames))
+            for drawn_frame, expected_frame in zip(drawn_frames, expected_frames):
+                np.testing.assert_array_equal(drawn_frame, expected_frame)
+
+    def test_video_detection_iter_drawn_into_wrong_buffer_shape(self):
+        images_predictions = self._get_image_detection_predictions(num_frames=2)
+        buf = np.empty((10, 10, 3), dtype=np.uint8)
+        with self.assertRaises(ValueError):
+            list(self._get_video_detection_prediction(images_predictions).iter_drawn_into(buf))
+
+    def test_video_detection_frame_buffers_with_slow_consumer(self):
+        # Frames are drawn in a ring of buffers in a background thread, as in VideoDetectionPrediction.save/show.
+        # A slow consumer lets the background thread fill the queue, which is when a frame is the most likely to be overwritten before it is consumed.
+        images_predictions = self._get_image_detection_predictions(num_frames=4 * _VIDEO_PIPELINE_QUEUE_SIZE, height=48, width=64)
+        expected_frames = list(self._get_video_detection_prediction(images_predictions).draw(num_frame_buffers=0))
+
+        frames = self._get_video_detection_prediction(images_predictions)._draw_frames_in_background(
+            box_thickness=None, show_confidence=True, color_mapping=None, class_names=None
+        )
+        consumed_frames = []
+        for frame in frames:
+            time.sleep(0.01)
+            consumed_frames.append(frame.copy())
+
+        self.assertEqual(len(consumed_frames), len(expected_frames))
+        for consumed_frame, expected_frame in zip(consumed_frames, expected_frames):
+            np.testing.assert_array_equal(consumed_frame, expected_frame)
+
+    def test_video_segmentation_draw_batched_matches_draw(self):
+        if not torch.cuda.is_available():
+            self.skipTest("CUDA is not available, so draw_batched falls back to draw")
+
+        images_predictions = []
+        for _ in range(7):
+            image = self.rng.integers(0, 256, size=(48, 64, 3), dtype=np.uint8)
+            segmentation_map = self.rng.integers(0, len(self.class_names), size=(48, 64))
+            prediction = SegmentationPrediction(segmentation_map=segmentation_map, segmentation_map_shape=(48, 64), image_shape=(48, 64))
+            images_predictions.append(ImageSegmentationPrediction(image=image, prediction=prediction, class_names=self.class_names))
+        video_prediction = VideoSegmentationPrediction(
+            _images_prediction_gen=iter(images_predictions), _images_prediction_lst=images_predictions, fps=10, n_frames=len(images_predictions)
+        )
+
+        for alpha in (0.0, 0.3, 0.6, 1.0):
+            expected_frames = list(video_prediction.draw(alpha=alpha))
+            # A batch size which does not divide the number of frames, and the default one derived from the frame resolution.
+            for batch_size in (3, None):
+                drawn_frames = list(video_prediction.draw_batched(alpha=alpha, batch_size=batch_size))
+                self.assertEqual(len(drawn_frames), len(expected_frames))
+                for drawn_frame, expected_frame in zip(drawn_frames, expected_frames):
+                    np.testing.assert_array_equal(drawn_frame, expected_frame)
+
+    def test_iterate_in_background_preserves_order(self):
+        items = list(range(100))
+        self.assertEqual(list(_iterate_in_background(iter(items), max_queue_size=3)), items)
+
+    def test_iterate_in_background_reraises_producer_exception(self):
+        def _failing_gen(exception: BaseException) -> Iterator[int]:
+            yield 0
+            yield 1
+            raise exception
+
+        for exception in (RuntimeError("producer failed"), _ProducerInterrupt()):
+            consumed = []
+            with self.assertRaises(type(exception)):
+                for item in _iterate_in_background(_failing_gen(exception)):
+                    consumed.append(item)
+            self.assertEqual(consumed, [0, 1])
+
+    def test_iterate_in_background_stops_producer_when_consumer_stops_early(self):
+        num_produced = 0
+
+        def _infinite_gen() -> Iterator[int]:
+            nonlocal num_produced
+            while True:
+                num_produced += 1
+                yield num_produced
+
+        threads_before = set(threading.enumerate())
+        iterator = _iterate_in_background(_infinite_gen(), max_queue_size=2)
+        self.assertEqual([next(iterator) for _ in range(3)], [1, 2, 3])
+        producer_threads = set(threading.enumerate()) - threads_before
+        self.assertEqual(len(producer_threads), 1)
+
+        iterator.close()
+        for thread in producer_threads:
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())
+
+        # The producer is at most a full queue, plus the item it was waiting to put, ahead of the consumer.
+        self.assertLessEqual(num_produced, 3 + 2 + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
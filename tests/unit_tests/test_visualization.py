@@ -0,0 +1,107 @@
+import unittest
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+import torch
+
+from super_gradients.training.utils.visualization.detection import draw_bbox, get_recommended_box_thickness, get_recommended_text_size
+from super_gradients.training.utils.visualization.segmentation import (
+    blend_segmentation,
+    blend_segmentation_batch,
+    get_color_lut,
+    _blend_segmentation_cv2,
+    _blend_segmentation_numpy,
+)
+from super_gradients.training.utils.visualization.utils import draw_text_box, generate_color_mapping
+
+
+def _draw_bbox_reference(
+    image: np.ndarray, title: Optional[str], color: Tuple[int, int, int], box_thickness: Optional[int], x1: int, y1: int, x2: int, y2: int
+) -> np.ndarray:
+    """Reference implementation of draw_bbox, which blends the overlay over the whole image."""
+    if box_thickness is None:
+        box_thickness = get_recommended_box_thickness(x1=x1, y1=y1, x2=x2, y2=y2)
+    overlay = cv2.rectangle(image.copy(), (x1, y1), (x2, y2), color, box_thickness)
+    font_size = get_recommended_text_size(x1=x1, y1=y1, x2=x2, y2=y2)
+    overlay = draw_text_box(image=overlay, text=title, x=x1, y=y1, font=2, font_size=font_size, background_color=color, thickness=1)
+    return cv2.addWeighted(overlay, 0.75, image, 0.25, 0)
+
+
+class TestVisualization(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(seed=42)
+
+    def test_draw_bbox_inplace_on_non_contiguous_image(self):
+        image = self.rng.integers(0, 256, size=(120, 160, 3), dtype=np.uint8)
+        expected_image = _draw_bbox_reference(image, "person 0.87", (255, 0, 0), 2, 20, 30, 100, 90)
+
+        # Images which OpenCV cannot write in place: Fortran order, and a BGR buffer viewed as RGB.
+        for layout_image in (np.asfortranarray(image), np.ascontiguousarray(image[..., ::-1])[..., ::-1]):
+            drawn_image = draw_bbox(layout_image, "person 0.87", (255, 0, 0), 2, 20, 30, 100, 90, inplace=True)
+            self.assertIs(drawn_image, layout_image)
+            np.testing.assert_array_equal(layout_image, expected_image)
+
+    def test_blend_segmentation_cv2_matches_numpy(self):
+        num_classes = 30
+        image = self.rng.integers(0, 256, size=(37, 53, 3), dtype=np.uint8)
+        segmentation_map = self.rng.integers(0, num_classes, size=(37, 53))
+        color_lut = get_color_lut(generate_color_mapping(num_classes))
+
+        for alpha in (0.0, 1 / 256, 0.1, 0.3, 0.5, 0.6, 0.77, 255 / 256, 1.0):
+            expected_image = _blend_segmentation_numpy(image=image, segmentation_map=segmentation_map, color_lut=color_lut, alpha=alpha, out=None)
+            blended_image = _blend_segmentation_cv2(image=image, segmentation_map=segmentation_map, color_lut=color_lut, alpha=alpha, out=None)
+            np.testing.assert_array_equal(blended_image, expected_image)
+
+            # Same result when blending into a preallocated output.
+            out = np.empty_like(image)
+            self.assertIs(_blend_segmentation_cv2(image=image, segmentation_map=segmentation_map, color_lut=color_lut, alpha=alpha, out=out), out)
+            np.testing.assert_array_equal(out, expected_image)
+
+    def test_blend_segmentation_batch_matches_blend_segmentation(self):
+        num_classes = 20
+        images = self.rng.integers(0, 256, size=(4, 32, 48, 3), dtype=np.uint8)
+        segmentation_maps = self.rng.integers(0, num_classes, size=(4, 32, 48))
+        color_lut = get_color_lut(generate_color_mapping(num_classes))
+
+        # Odd and even quantized alphas take different paths of the int16 blending.
+        for alpha in (0.0, 1 / 256, 0.3, 0.5, 0.6, 255 / 256, 1.0):
+            blended_images = blend_segmentation_batch(
+                images=torch.from_numpy(images.copy()),
+                segmentation_maps=torch.from_numpy(segmentation_maps),
+                color_lut=torch.from_numpy(color_lut),
+                alpha=alpha,
+            ).numpy()
+            for image, segmentation_map, blended_image in zip(images, segmentation_maps, blended_images):
+                expected_image = blend_segmentation(image=image, segmentation_map=segmentation_map, color_lut=color_lut, alpha=alpha)
+                np.testing.assert_array_equal(blended_image, expected_image)
+
+    def test_draw_bbox_matches_whole_image_blending(self):
+        for i in range(500):
+            height, width = self.rng.integers(20, 300, size=2)
+            image = self.rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+            # Boxes partially or fully outside the image, and boxes with flipped corners.
+            x1, x2 = sorted(int(x) for x in self.rng.integers(-50, width + 50, size=2))
+            y1, y2 = sorted(int(y) for y in self.rng.integers(-50, height + 50, size=2))
+            if i % 5 == 0:
+                x1, x2 = x2, x1
+            if i % 7 == 0:
+                y1, y2 = y2, y1
+            title = ["person 0.87", "", "a very long title for a small box 0.5"][i % 3]
+            box_thickness = [None, 1, 2, 5][i % 4]
+            color = tuple(int(c) for c in self.rng.integers(0, 256, size=3))
+
+            expected_image = _draw_bbox_reference(image, title, color, box_thickness, x1, y1, x2, y2)
+
+            original_image = image.copy()
+            drawn_image = draw_bbox(image, title, color, box_thickness, x1, y1, x2, y2)
+            np.testing.assert_array_equal(image, original_image)
+            np.testing.assert_array_equal(drawn_image, expected_image)
+
+            drawn_image = draw_bbox(image, title, color, box_thickness, x1, y1, x2, y2, inplace=True)
+            self.assertIs(drawn_image, image)
+            np.testing.assert_array_equal(image, expected_image)
+
+
+if __name__ == "__main__":
+    unittest.main()